@@ -6,6 +6,7 @@ from flask_migrate import Migrate
 import os
 import re
 from database import db, init_db
+from utils.json_utils import ORJSONProvider
 
 # Load environment variables from .env file
 from dotenv import load_dotenv 
@@ -14,17 +15,25 @@ load_dotenv()
 
 def create_app():
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     
     # --- Configuration ---
     app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'default-fallback-secret-key')
     
     # ✅ CORS Configuration - UPDATED
     CORS(app,
-         resources={r"/api/*": {"origins": "*"}},
+         resources={
+             r"/api/*": {"origins": "*"},
+             # Paginated list endpoints outside /api: cross-origin clients need
+             # expose_headers here to read X-Next-Cursor
+             r"/customers": {"origins": "*"},
+             r"/jobs": {"origins": "*"},
+             r"/pipeline": {"origins": "*"},
+         },
          supports_credentials=True,
-         allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-Tenant-ID"],
+         allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-Tenant-ID", "If-None-Match"],
          methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-         expose_headers=["Content-Type", "Authorization"],
+         expose_headers=["Content-Type", "Authorization", "X-Next-Cursor", "ETag"],
     )
     
     # Handle OPTIONS requests explicitly
@@ -35,7 +44,7 @@ def create_app():
             headers = response.headers
             headers['Access-Control-Allow-Origin'] = '*'
             headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, PATCH, DELETE, OPTIONS'
-            headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With, X-Tenant-ID'  # ✅ ADD X-Tenant-ID
+            headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With, X-Tenant-ID, If-None-Match'  # ✅ ADD X-Tenant-ID
             headers['Access-Control-Max-Age'] = '3600'
             return response
     
@@ -64,6 +73,15 @@ def create_app():
     # Initialize Flask-Migrate
     migrate = Migrate(app, db)
     
+    # Development only: log lazy-load N+1 queries (pip install nplusone, set NPLUSONE=1)
+    if os.getenv('NPLUSONE') == '1':
+        try:
+            from nplusone.ext.flask_sqlalchemy import NPlusOne
+            NPlusOne(app)
+            print("🔎 nplusone N+1 detection enabled")
+        except ImportError:
+            print("⚠️  NPLUSONE=1 but nplusone is not installed")
+    
     # ============================================================
     # 🎯 NEW: Import all models to ensure they're registered with SQLAlchemy
     # ============================================================
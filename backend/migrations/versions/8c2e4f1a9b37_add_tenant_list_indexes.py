@@ -0,0 +1,65 @@
+"""Add list-endpoint and ETag-version indexes
+
+Revision ID: 8c2e4f1a9b37
+Revises: 3fdb6c470743
+Create Date: 2026-10-15 10:12:41.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e4f1a9b37'
+down_revision = '3fdb6c470743'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # created_at is the keyset paging key; backfill NULLs (oldest-last) and make it NOT NULL
+    for table in ('customers', 'opportunities', 'jobs'):
+        op.execute(sa.text(
+            f"UPDATE {table} SET created_at = COALESCE(updated_at, TIMESTAMP '1970-01-01') "
+            "WHERE created_at IS NULL"
+        ))
+
+    with op.batch_alter_table('customers', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_customers_tenant_created', ['tenant_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_customers_tenant_updated', ['tenant_id', 'updated_at'], unique=False)
+        batch_op.create_index('ix_customers_updated', ['updated_at'], unique=False)
+
+    with op.batch_alter_table('opportunities', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_opportunities_tenant_created', ['tenant_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_opportunities_tenant_updated', ['tenant_id', 'updated_at'], unique=False)
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_jobs_created', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_jobs_updated', ['updated_at'], unique=False)
+
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.create_index('ix_assignments_tenant_date', ['tenant_id', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.drop_index('ix_assignments_tenant_date')
+
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_jobs_updated')
+        batch_op.drop_index('ix_jobs_created')
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
+
+    with op.batch_alter_table('opportunities', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunities_tenant_updated')
+        batch_op.drop_index('ix_opportunities_tenant_created')
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
+
+    with op.batch_alter_table('customers', schema=None) as batch_op:
+        batch_op.drop_index('ix_customers_updated')
+        batch_op.drop_index('ix_customers_tenant_updated')
+        batch_op.drop_index('ix_customers_tenant_created')
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
@@ -355,7 +355,7 @@ class Customer(db.Model):
     
     # Audit Fields
     created_by = db.Column(db.String(200))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # keyset paging key
     updated_by = db.Column(db.String(200))
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -367,6 +367,14 @@ class Customer(db.Model):
     form_submissions = db.relationship('FormSubmission', back_populates='customer', lazy=True)
     assignments = db.relationship('Assignment', backref='customer_rel', lazy=True, passive_deletes='all')
 
+    # Tenant-scoped newest-first listing / keyset paging on (created_at, id)
+    __table_args__ = (
+        db.Index('ix_customers_tenant_created', 'tenant_id', 'created_at', 'id'),
+        # ETag version: max(updated_at) per tenant (/pipeline) and across all rows (/jobs)
+        db.Index('ix_customers_tenant_updated', 'tenant_id', 'updated_at'),
+        db.Index('ix_customers_updated', 'updated_at'),
+    )
+
     def update_stage_from_opportunity(self):
         """Update customer stage based on primary opportunity"""
         primary_opp = self.get_primary_opportunity()
@@ -418,7 +426,7 @@ class Opportunity(db.Model):
     # Dates
     expected_close_date = db.Column(db.DateTime)
     actual_close_date = db.Column(db.DateTime)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # keyset paging key
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Team Assignments
@@ -454,6 +462,13 @@ class Opportunity(db.Model):
     payments = db.relationship('Payment', back_populates='opportunity', lazy=True, cascade='all, delete-orphan')
     assignments = db.relationship('Assignment', backref='opportunity_rel', lazy=True, passive_deletes='all')
 
+    # Tenant-scoped newest-first listing / keyset paging on (created_at, id)
+    __table_args__ = (
+        db.Index('ix_opportunities_tenant_created', 'tenant_id', 'created_at', 'id'),
+        # ETag version: max(updated_at) per tenant (/pipeline)
+        db.Index('ix_opportunities_tenant_updated', 'tenant_id', 'updated_at'),
+    )
+
     def __repr__(self):
         return f'<Opportunity {self.opportunity_reference or self.id}: {self.opportunity_name}>'
 
@@ -498,7 +513,7 @@ class Job(db.Model):
     start_date = db.Column(db.Date, nullable=True)
     due_date = db.Column(db.Date)
     completion_date = db.Column(db.Date)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # keyset paging key
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Financial
@@ -528,6 +543,13 @@ class Job(db.Model):
     tenant = db.relationship('Tenant')
     customer = db.relationship("Customer", backref="jobs")
 
+    # Newest-first listing / keyset paging on (created_at, id); GET /jobs isn't tenant-filtered
+    __table_args__ = (
+        db.Index("ix_jobs_created", "created_at", "id"),
+        # ETag version: max(updated_at) across all jobs (/jobs)
+        db.Index("ix_jobs_updated", "updated_at"),
+    )
+
     def __repr__(self):
         return f"<Job {self.job_reference}: {self.title}>"
 
@@ -651,6 +673,11 @@ class Assignment(db.Model):
     opportunity = db.relationship('Opportunity', backref='opportunity_assignments', viewonly=True)
     customer = db.relationship('Customer', backref='customer_assignments', viewonly=True)
     tenant = db.relationship('Tenant')
+
+    # Calendar month view: tenant filter + date range, ordered by date
+    __table_args__ = (
+        db.Index('ix_assignments_tenant_date', 'tenant_id', 'date'),
+    )
     
     def __repr__(self):
         return f'<Assignment {self.id}: {self.title} on {self.date}>'
@@ -658,10 +685,11 @@ class Assignment(db.Model):
     def calculate_hours(self):
         """Calculate hours from start_time and end_time"""
         if self.start_time and self.end_time:
-            start_datetime = datetime.combine(datetime.today(), self.start_time)
-            end_datetime = datetime.combine(datetime.today(), self.end_time)
-            duration = end_datetime - start_datetime
-            return duration.total_seconds() / 3600
+            # Plain seconds-of-day arithmetic; no need to build datetimes to subtract two times
+            start, end = self.start_time, self.end_time
+            start_seconds = start.hour * 3600 + start.minute * 60 + start.second
+            end_seconds = end.hour * 3600 + end.minute * 60 + end.second
+            return (end_seconds - start_seconds) / 3600
         return self.estimated_hours or 0
     
     def to_dict(self):
@@ -1,8 +1,10 @@
 from flask import Blueprint, request, jsonify, g
 from datetime import datetime, date
 from database import db
-from models import Assignment, TeamMember, Job, Customer
+from models import Assignment, TeamMember, Job, Customer, Opportunity
 from tenant_middleware import require_tenant as token_required
+from sqlalchemy.orm import joinedload
+from utils.date_utils import parse_date, parse_time
 
 
 assignment_bp = Blueprint("assignment", __name__, url_prefix="/assignments")
@@ -36,7 +38,13 @@ def get_assignments():
     month = request.args.get("month")  # YYYY-MM
 
     # ✅ FILTER BY TENANT
-    query = Assignment.query.filter_by(tenant_id=g.tenant_id)
+    # to_dict() reads staff.name, customer.name and opportunity.opportunity_reference;
+    # JOIN them in up front instead of three lazy SELECTs per assignment
+    query = Assignment.query.options(
+        joinedload(Assignment.staff).load_only(TeamMember.name),
+        joinedload(Assignment.customer).load_only(Customer.name),
+        joinedload(Assignment.opportunity).load_only(Opportunity.opportunity_reference),
+    ).filter_by(tenant_id=g.tenant_id)
 
     if month:
         try:
@@ -85,14 +93,14 @@ def create_assignment():
     
     if data.get('start_date'):
         try:
-            start_date_value = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
+            start_date_value = parse_date(data['start_date'])
             date_value = start_date_value  # Also set date for backward compatibility
         except Exception as e:
             print(f"❌ Error parsing start_date: {e}")
             return jsonify({'error': 'Invalid start_date format'}), 400
     elif data.get('date'):
         try:
-            date_value = datetime.strptime(data['date'], '%Y-%m-%d').date()
+            date_value = parse_date(data['date'])
             start_date_value = date_value  # Also set start_date
         except Exception as e:
             print(f"❌ Error parsing date: {e}")
@@ -109,7 +117,7 @@ def create_assignment():
     
     if data.get('end_date'):
         try:
-            end_date_value = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+            end_date_value = parse_date(data['end_date'])
             # Also validate end_date
             if end_date_value < today:
                 return jsonify({
@@ -161,13 +169,13 @@ def create_assignment():
     end_time = None
     if data.get('start_time'):
         try:
-            start_time = datetime.strptime(data['start_time'], '%H:%M').time()
+            start_time = parse_time(data['start_time'])
         except ValueError:
             print(f"Invalid start_time format: {data['start_time']}")
     
     if data.get('end_time'):
         try:
-            end_time = datetime.strptime(data['end_time'], '%H:%M').time()
+            end_time = parse_time(data['end_time'])
         except ValueError:
             print(f"Invalid end_time format: {data['end_time']}")
 
@@ -252,17 +260,17 @@ def update_assignment(assignment_id):
         
         # ✅ Handle date updates for drag and drop
         if 'start_date' in data and data['start_date']:
-            assignment.start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
+            assignment.start_date = parse_date(data['start_date'])
             assignment.date = assignment.start_date  # Keep date in sync
             print(f"📅 Updated start_date to: {assignment.start_date}")
         elif 'date' in data and data['date']:
-            assignment.date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+            assignment.date = parse_date(data['date'])
             if not assignment.start_date:
                 assignment.start_date = assignment.date
             print(f"📅 Updated date to: {assignment.date}")
         
         if 'end_date' in data and data['end_date']:
-            assignment.end_date = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+            assignment.end_date = parse_date(data['end_date'])
             print(f"📅 Updated end_date to: {assignment.end_date}")
         elif 'start_date' in data and not ('end_date' in data):
             # If only start_date provided, set end_date same as start_date
@@ -271,13 +279,13 @@ def update_assignment(assignment_id):
         
         if 'start_time' in data:
             try:
-                assignment.start_time = datetime.strptime(data['start_time'], '%H:%M').time() if data['start_time'] else None
+                assignment.start_time = parse_time(data['start_time']) if data['start_time'] else None
             except ValueError:
                 print(f"Invalid start_time: {data['start_time']}")
         
         if 'end_time' in data:
             try:
-                assignment.end_time = datetime.strptime(data['end_time'], '%H:%M').time() if data['end_time'] else None
+                assignment.end_time = parse_time(data['end_time']) if data['end_time'] else None
             except ValueError:
                 print(f"Invalid end_time: {data['end_time']}")
         
@@ -5,6 +5,7 @@ from models import Customer, CustomerFormData, Opportunity
 import json
 from datetime import datetime
 from tenant_middleware import require_tenant as token_required
+from utils.pagination import get_page_args, keyset_paginate, next_cursor
 
 customer_bp = Blueprint('customer', __name__)
 
@@ -104,15 +105,19 @@ def handle_customers():
     
     # GET all customers - filtered by tenant
     name_query = request.args.get('name', type=str)
+    try:
+        limit, cursor = get_page_args(request.args)  # optional ?limit=&cursor= keyset paging
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     query = Customer.query.filter_by(tenant_id=g.tenant_id)  # CRITICAL: Filter by tenant
     
     if name_query:
         query = query.filter(Customer.name.ilike(f"%{name_query}%"))
     
-    customers = query.order_by(Customer.created_at.desc()).all()
+    customers = keyset_paginate(query, Customer, limit, cursor).all()
     
-    return jsonify([
+    response = jsonify([
         {
             'id': c.id,
             'name': c.name,
@@ -137,6 +142,11 @@ def handle_customers():
         }
         for c in customers
     ])
+    
+    cursor_out = next_cursor(customers, limit)
+    if cursor_out:
+        response.headers['X-Next-Cursor'] = cursor_out
+    return response
 
 @customer_bp.route('/customers/<string:customer_id>', methods=['GET', 'PUT', 'DELETE'])
 @token_required
@@ -1,5 +1,5 @@
 # routes/db_routes.py
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify, g, current_app, Response, stream_with_context
 from database import db
 from models import (
     Customer, Opportunity, Activity, OpportunityNote, OpportunityDocument,
@@ -8,12 +8,68 @@ from models import (
     Salesperson, FormSubmission, CustomerFormData, AuditLog, Assignment
 )
 from tenant_middleware import token_required
+from utils.pagination import get_page_args, keyset_paginate, next_cursor
+from utils.json_utils import make_serializer
+from utils.etag import make_etag, not_modified
+from utils.date_utils import parse_date, parse_datetime
+from sqlalchemy import and_, insert
+from sqlalchemy.orm import selectinload, joinedload, raiseload, load_only
 import json
 from datetime import datetime
+from itertools import groupby
 
 # Create blueprint
 db_bp = Blueprint('database', __name__)
 
+# Opportunity -> JSON field maps, built once at import
+_serialize_opportunity = make_serializer({
+    'id': 'id',
+    'customer_id': 'customer_id',
+    'opportunity_name': 'opportunity_name',
+    'opportunity_reference': 'opportunity_reference',
+    'stage': 'stage',
+    'priority': 'priority',
+    'estimated_value': 'estimated_value',
+    'probability': 'probability',
+    'expected_close_date': 'expected_close_date',
+    'actual_close_date': 'actual_close_date',
+    'salesperson_name': 'salesperson_name',
+    'notes': 'notes',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+})
+
+# Jobs are opportunities exposed under the older job field names
+_serialize_job = make_serializer({
+    'id': 'id',
+    'customer_id': 'customer_id',
+    'job_name': 'opportunity_name',
+    'job_reference': 'opportunity_reference',
+    'stage': 'stage',
+    'priority': 'priority',
+    'estimated_value': 'estimated_value',
+    'agreed_value': 'estimated_value',
+    'probability': 'probability',
+    'due_date': 'expected_close_date',
+    'completion_date': 'actual_close_date',
+    'salesperson': 'salesperson_name',
+    'notes': 'notes',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+})
+
+
+def _opportunity_to_json(o):
+    data = _serialize_opportunity(o)
+    data['customer_name'] = o.customer.name if o.customer else None
+    return data
+
+
+def _job_to_json(o):
+    data = _serialize_job(o)
+    data['job_type'] = 'General'
+    return data
+
 # ----------------------------------
 # Opportunity Routes
 # ----------------------------------
@@ -33,7 +89,7 @@ def handle_opportunities():
             priority=data.get('priority', 'Medium'),
             estimated_value=data.get('estimated_value'),
             probability=data.get('probability'),
-            expected_close_date=datetime.strptime(data['expected_close_date'], '%Y-%m-%d') if data.get('expected_close_date') else None,
+            expected_close_date=parse_datetime(data['expected_close_date']) if data.get('expected_close_date') else None,
             salesperson_name=data.get('salesperson_name'),
             notes=data.get('notes'),
         )
@@ -48,33 +104,17 @@ def handle_opportunities():
     
     # GET opportunities (filtered by tenant)
     customer_id = request.args.get('customer_id')
-    query = Opportunity.query.filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
+    query = Opportunity.query.options(
+        joinedload(Opportunity.customer).load_only(Customer.name),
+        raiseload('*', sql_only=True),
+    ).filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
     
     if customer_id:
         query = query.filter_by(customer_id=customer_id)
     
     opportunities = query.order_by(Opportunity.created_at.desc()).all()
     
-    return jsonify([
-        {
-            'id': o.id,
-            'customer_id': o.customer_id,
-            'customer_name': o.customer.name if o.customer else None,
-            'opportunity_name': o.opportunity_name,
-            'opportunity_reference': o.opportunity_reference,
-            'stage': o.stage,
-            'priority': o.priority,
-            'estimated_value': float(o.estimated_value) if o.estimated_value else None,
-            'probability': o.probability,
-            'expected_close_date': o.expected_close_date.isoformat() if o.expected_close_date else None,
-            'actual_close_date': o.actual_close_date.isoformat() if o.actual_close_date else None,
-            'salesperson_name': o.salesperson_name,
-            'notes': o.notes,
-            'created_at': o.created_at.isoformat() if o.created_at else None,
-            'updated_at': o.updated_at.isoformat() if o.updated_at else None
-        }
-        for o in opportunities
-    ])
+    return jsonify([_opportunity_to_json(o) for o in opportunities])
 
 @db_bp.route('/opportunities/<string:opportunity_id>', methods=['GET', 'PUT', 'DELETE'])
 @token_required  # ADD THIS
@@ -89,23 +129,7 @@ def handle_single_opportunity(opportunity_id):
         return jsonify({'error': 'Opportunity not found'}), 404
     
     if request.method == 'GET':
-        return jsonify({
-            'id': opportunity.id,
-            'customer_id': opportunity.customer_id,
-            'customer_name': opportunity.customer.name if opportunity.customer else None,
-            'opportunity_name': opportunity.opportunity_name,
-            'opportunity_reference': opportunity.opportunity_reference,
-            'stage': opportunity.stage,
-            'priority': opportunity.priority,
-            'estimated_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
-            'probability': opportunity.probability,
-            'expected_close_date': opportunity.expected_close_date.isoformat() if opportunity.expected_close_date else None,
-            'actual_close_date': opportunity.actual_close_date.isoformat() if opportunity.actual_close_date else None,
-            'salesperson_name': opportunity.salesperson_name,
-            'notes': opportunity.notes,
-            'created_at': opportunity.created_at.isoformat() if opportunity.created_at else None,
-            'updated_at': opportunity.updated_at.isoformat() if opportunity.updated_at else None,
-        })
+        return jsonify(_opportunity_to_json(opportunity))
     
     elif request.method == 'PUT':
         data = request.json
@@ -116,9 +140,9 @@ def handle_single_opportunity(opportunity_id):
         opportunity.probability = data.get('probability', opportunity.probability)
         
         if data.get('expected_close_date'):
-            opportunity.expected_close_date = datetime.strptime(data['expected_close_date'], '%Y-%m-%d')
+            opportunity.expected_close_date = parse_datetime(data['expected_close_date'])
         if data.get('actual_close_date'):
-            opportunity.actual_close_date = datetime.strptime(data['actual_close_date'], '%Y-%m-%d')
+            opportunity.actual_close_date = parse_datetime(data['actual_close_date'])
         
         opportunity.salesperson_name = data.get('salesperson_name', opportunity.salesperson_name)
         opportunity.notes = data.get('notes', opportunity.notes)
@@ -140,36 +164,48 @@ def handle_single_opportunity(opportunity_id):
 def handle_proposals():
     if request.method == 'POST':
         data = request.json
-        proposal = Proposal(
-            tenant_id=g.tenant_id,  # ADD THIS
-            customer_id=data['customer_id'],
-            reference_number=data.get('reference_number'),
-            title=data.get('title'),
-            total=data['total'],
-            status=data.get('status', 'Draft'),
-            valid_until=datetime.strptime(data['valid_until'], '%Y-%m-%d').date() if data.get('valid_until') else None,
-            notes=data.get('notes')
-        )
-        db.session.add(proposal)
-        db.session.flush()
+        # INSERT ... RETURNING id hands back the key directly, no ORM add()/flush() round
+        proposal_id = db.session.execute(
+            insert(Proposal).returning(Proposal.id),
+            {
+                'tenant_id': g.tenant_id,  # ADD THIS
+                'customer_id': data['customer_id'],
+                'reference_number': data.get('reference_number'),
+                'title': data.get('title'),
+                'total': data['total'],
+                'status': data.get('status', 'Draft'),
+                'valid_until': parse_date(data['valid_until']) if data.get('valid_until') else None,
+                'notes': data.get('notes'),
+            }
+        ).scalar_one()
 
-        for item in data.get('items', []):
-            p_item = ProposalItem(
-                tenant_id=g.tenant_id,  # ADD THIS
-                proposal_id=proposal.id,
-                product_id=item.get('product_id'),
-                description=item['description'],
-                quantity=item.get('quantity', 1),
-                unit_price=item['unit_price']
-            )
-            p_item.calculate_line_total()
-            db.session.add(p_item)
+        # One multi-row INSERT for all items instead of an ORM add() per item
+        items = [
+            {
+                'tenant_id': g.tenant_id,  # ADD THIS
+                'proposal_id': proposal_id,
+                'product_id': item.get('product_id'),
+                'description': item['description'],
+                'quantity': item.get('quantity', 1),
+                'unit_price': item['unit_price'],
+                # Same as ProposalItem.calculate_line_total()
+                'line_total': (item['unit_price'] or 0) * (item.get('quantity', 1) or 0),
+            }
+            for item in data.get('items', [])
+        ]
+        if items:
+            db.session.execute(insert(ProposalItem), items)
 
         db.session.commit()
-        return jsonify({'id': proposal.id, 'message': 'Proposal created successfully'}), 201
+        return jsonify({'id': proposal_id, 'message': 'Proposal created successfully'}), 201
 
     customer_id = request.args.get('customer_id', type=str)
-    query = Proposal.query.filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
+    # Eager-load items (one batched IN query) and customer (JOIN) to avoid N+1 lazy loads
+    query = Proposal.query.options(
+        selectinload(Proposal.items),
+        joinedload(Proposal.customer).load_only(Customer.name),
+        raiseload('*', sql_only=True),
+    ).filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
     
     if customer_id:
         query = query.filter_by(customer_id=customer_id)
@@ -183,18 +219,18 @@ def handle_proposals():
             'customer_name': p.customer.name if p.customer else None,
             'reference_number': p.reference_number,
             'title': p.title,
-            'total': float(p.total) if p.total else None,
+            'total': p.total,
             'status': p.status,
-            'valid_until': p.valid_until.isoformat() if p.valid_until else None,
+            'valid_until': p.valid_until,
             'notes': p.notes,
-            'created_at': p.created_at.isoformat() if p.created_at else None,
+            'created_at': p.created_at,
             'items': [
                 {
                     'id': i.id,
                     'description': i.description,
                     'quantity': i.quantity,
-                    'unit_price': float(i.unit_price) if i.unit_price else None,
-                    'line_total': float(i.line_total) if i.line_total else None
+                    'unit_price': i.unit_price,
+                    'line_total': i.line_total
                 } for i in p.items
             ]
         } for p in proposals
@@ -215,23 +251,26 @@ def handle_invoices():
             opportunity_id=data['opportunity_id'],
             invoice_number=data['invoice_number'],
             status=data.get('status', 'Draft'),
-            due_date=datetime.strptime(data['due_date'], '%Y-%m-%d').date() if data.get('due_date') else None,
+            due_date=parse_date(data['due_date']) if data.get('due_date') else None,
         )
         
         db.session.add(invoice)
         db.session.flush()
         
-        # Add line items
-        for item in data.get('line_items', []):
-            line_item = InvoiceLineItem(
-                tenant_id=g.tenant_id,  # ADD THIS
-                invoice_id=invoice.id,
-                description=item['description'],
-                quantity=item.get('quantity', 1),
-                unit_price=item['unit_price'],
-                tax_rate=item.get('tax_rate', 0)
-            )
-            db.session.add(line_item)
+        # Add line items (single multi-row INSERT)
+        line_items = [
+            {
+                'tenant_id': g.tenant_id,  # ADD THIS
+                'invoice_id': invoice.id,
+                'description': item['description'],
+                'quantity': item.get('quantity', 1),
+                'unit_price': item['unit_price'],
+                'tax_rate': item.get('tax_rate', 0),
+            }
+            for item in data.get('line_items', [])
+        ]
+        if line_items:
+            db.session.execute(insert(InvoiceLineItem), line_items)
         
         db.session.commit()
         
@@ -242,7 +281,12 @@ def handle_invoices():
     
     # GET invoices (filtered by tenant)
     opportunity_id = request.args.get('opportunity_id')
-    query = Invoice.query.filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
+    # amount_due/amount_paid iterate line_items and payments - batch-load both
+    query = Invoice.query.options(
+        selectinload(Invoice.line_items),
+        selectinload(Invoice.payments),
+        raiseload('*', sql_only=True),
+    ).filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
     
     if opportunity_id:
         query = query.filter_by(opportunity_id=opportunity_id)
@@ -255,8 +299,8 @@ def handle_invoices():
             'opportunity_id': i.opportunity_id,
             'invoice_number': i.invoice_number,
             'status': i.status,
-            'due_date': i.due_date.isoformat() if i.due_date else None,
-            'paid_date': i.paid_date.isoformat() if i.paid_date else None,
+            'due_date': i.due_date,
+            'paid_date': i.paid_date,
             'amount_due': float(i.amount_due),
             'amount_paid': float(i.amount_paid),
             'balance': float(i.balance),
@@ -293,7 +337,7 @@ def handle_teams():
             'name': t.name,
             'specialty': t.specialty,
             'active': t.active,
-            'created_at': t.created_at.isoformat() if t.created_at else None
+            'created_at': t.created_at
         }
         for t in teams
     ])
@@ -325,7 +369,7 @@ def handle_salespeople():
             'email': s.email,
             'phone': s.phone,
             'active': s.active,
-            'created_at': s.created_at.isoformat() if s.created_at else None
+            'created_at': s.created_at
         }
         for s in salespeople
     ])
@@ -334,97 +378,65 @@ def handle_salespeople():
 # Job Routes (mapped to Opportunities)
 # ----------------------------------
 
-@db_bp.route('/jobs', methods=['GET', 'POST'])
+@db_bp.route('/jobs', methods=['POST'])
 @token_required  # ADD THIS
 def handle_jobs():
-    """Jobs are mapped to Opportunities in the backend"""
-    if request.method == 'POST':
-        data = request.json
-        
-        # Validate required fields
-        if not data.get('customer_id'):
-            return jsonify({'error': 'customer_id is required'}), 400
-        if not data.get('job_name'):
-            return jsonify({'error': 'job_name is required'}), 400
-        
-        # Create new opportunity (job)
-        opportunity = Opportunity(
-            tenant_id=g.tenant_id,  # ADD THIS
-            customer_id=data['customer_id'],
-            opportunity_name=data['job_name'],
-            opportunity_reference=data.get('job_reference'),
-            stage=data.get('stage', 'Prospect'),
-            priority=data.get('priority', 'Medium'),
-            estimated_value=data.get('estimated_value'),
-            probability=data.get('probability'),
-            expected_close_date=datetime.strptime(data['due_date'], '%Y-%m-%d') if data.get('due_date') else None,
-            actual_close_date=datetime.strptime(data['completion_date'], '%Y-%m-%d') if data.get('completion_date') else None,
-            salesperson_name=data.get('salesperson'),
-            notes=data.get('notes'),
-        )
-        
-        db.session.add(opportunity)
-        db.session.commit()
-        
-        # Return in job format
-        return jsonify({
-            'id': opportunity.id,
-            'customer_id': opportunity.customer_id,
-            'job_name': opportunity.opportunity_name,
-            'job_reference': opportunity.opportunity_reference,
-            'job_type': data.get('job_type', 'General'),
-            'stage': opportunity.stage,
-            'priority': opportunity.priority,
-            'estimated_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
-            'agreed_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
-            'deposit_amount': data.get('deposit_amount'),
-            'start_date': data.get('start_date'),
-            'due_date': opportunity.expected_close_date.isoformat() if opportunity.expected_close_date else None,
-            'completion_date': opportunity.actual_close_date.isoformat() if opportunity.actual_close_date else None,
-            'deposit_due_date': data.get('deposit_due_date'),
-            'salesperson': opportunity.salesperson_name,
-            'assigned_team': data.get('assigned_team'),
-            'primary_contact': data.get('primary_contact'),
-            'service_location': data.get('service_location'),
-            'requirements': data.get('requirements'),
-            'tags': data.get('tags'),
-            'notes': opportunity.notes,
-            'quote_id': data.get('quote_id'),
-            'created_at': opportunity.created_at.isoformat() if opportunity.created_at else None,
-            'updated_at': opportunity.updated_at.isoformat() if opportunity.updated_at else None,
-        }), 201
-    
-    # GET jobs (mapped to opportunities, filtered by tenant)
-    customer_id = request.args.get('customer_id')
-    query = Opportunity.query.filter_by(tenant_id=g.tenant_id)  # ADD TENANT FILTER
-    
-    if customer_id:
-        query = query.filter_by(customer_id=customer_id)
+    """Jobs are mapped to Opportunities in the backend.
+    GET /jobs is served by job_routes.get_jobs (job_bp is registered first)."""
+    data = request.json
     
-    opportunities = query.order_by(Opportunity.created_at.desc()).all()
+    # Validate required fields
+    if not data.get('customer_id'):
+        return jsonify({'error': 'customer_id is required'}), 400
+    if not data.get('job_name'):
+        return jsonify({'error': 'job_name is required'}), 400
+    
+    # Create new opportunity (job)
+    opportunity = Opportunity(
+        tenant_id=g.tenant_id,  # ADD THIS
+        customer_id=data['customer_id'],
+        opportunity_name=data['job_name'],
+        opportunity_reference=data.get('job_reference'),
+        stage=data.get('stage', 'Prospect'),
+        priority=data.get('priority', 'Medium'),
+        estimated_value=data.get('estimated_value'),
+        probability=data.get('probability'),
+        expected_close_date=parse_datetime(data['due_date']) if data.get('due_date') else None,
+        actual_close_date=parse_datetime(data['completion_date']) if data.get('completion_date') else None,
+        salesperson_name=data.get('salesperson'),
+        notes=data.get('notes'),
+    )
+    
+    db.session.add(opportunity)
+    db.session.commit()
     
-    return jsonify([
-        {
-            'id': o.id,
-            'customer_id': o.customer_id,
-            'customer_name': o.customer.name if o.customer else None,
-            'job_name': o.opportunity_name,
-            'job_reference': o.opportunity_reference,
-            'job_type': 'General',
-            'stage': o.stage,
-            'priority': o.priority,
-            'estimated_value': float(o.estimated_value) if o.estimated_value else None,
-            'agreed_value': float(o.estimated_value) if o.estimated_value else None,
-            'probability': o.probability,
-            'due_date': o.expected_close_date.isoformat() if o.expected_close_date else None,
-            'completion_date': o.actual_close_date.isoformat() if o.actual_close_date else None,
-            'salesperson': o.salesperson_name,
-            'notes': o.notes,
-            'created_at': o.created_at.isoformat() if o.created_at else None,
-            'updated_at': o.updated_at.isoformat() if o.updated_at else None
-        }
-        for o in opportunities
-    ])
+    # Return in job format
+    return jsonify({
+        'id': opportunity.id,
+        'customer_id': opportunity.customer_id,
+        'job_name': opportunity.opportunity_name,
+        'job_reference': opportunity.opportunity_reference,
+        'job_type': data.get('job_type', 'General'),
+        'stage': opportunity.stage,
+        'priority': opportunity.priority,
+        'estimated_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
+        'agreed_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
+        'deposit_amount': data.get('deposit_amount'),
+        'start_date': data.get('start_date'),
+        'due_date': opportunity.expected_close_date,
+        'completion_date': opportunity.actual_close_date,
+        'deposit_due_date': data.get('deposit_due_date'),
+        'salesperson': opportunity.salesperson_name,
+        'assigned_team': data.get('assigned_team'),
+        'primary_contact': data.get('primary_contact'),
+        'service_location': data.get('service_location'),
+        'requirements': data.get('requirements'),
+        'tags': data.get('tags'),
+        'notes': opportunity.notes,
+        'quote_id': data.get('quote_id'),
+        'created_at': opportunity.created_at,
+        'updated_at': opportunity.updated_at,
+    }), 201
 
 
 @db_bp.route('/jobs/<string:job_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -441,24 +453,7 @@ def handle_single_job(job_id):
         return jsonify({'error': 'Job not found'}), 404
     
     if request.method == 'GET':
-        job_data = {
-            'id': opportunity.id,
-            'customer_id': opportunity.customer_id,
-            'job_name': opportunity.opportunity_name,
-            'job_reference': opportunity.opportunity_reference,
-            'job_type': 'General',
-            'stage': opportunity.stage,
-            'priority': opportunity.priority,
-            'estimated_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
-            'agreed_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
-            'probability': opportunity.probability,
-            'due_date': opportunity.expected_close_date.isoformat() if opportunity.expected_close_date else None,
-            'completion_date': opportunity.actual_close_date.isoformat() if opportunity.actual_close_date else None,
-            'salesperson': opportunity.salesperson_name,
-            'notes': opportunity.notes,
-            'created_at': opportunity.created_at.isoformat() if opportunity.created_at else None,
-            'updated_at': opportunity.updated_at.isoformat() if opportunity.updated_at else None,
-        }
+        job_data = _job_to_json(opportunity)
         
         # Add customer information
         if opportunity.customer:
@@ -492,9 +487,9 @@ def handle_single_job(job_id):
         
         # Update dates
         if 'due_date' in data and data['due_date']:
-            opportunity.expected_close_date = datetime.strptime(data['due_date'], '%Y-%m-%d')
+            opportunity.expected_close_date = parse_datetime(data['due_date'])
         if 'completion_date' in data and data['completion_date']:
-            opportunity.actual_close_date = datetime.strptime(data['completion_date'], '%Y-%m-%d')
+            opportunity.actual_close_date = parse_datetime(data['completion_date'])
         
         # Update other fields
         if 'salesperson' in data:
@@ -514,8 +509,8 @@ def handle_single_job(job_id):
             'estimated_value': float(opportunity.estimated_value) if opportunity.estimated_value else None,
             'salesperson': opportunity.salesperson_name,
             'notes': opportunity.notes,
-            'created_at': opportunity.created_at.isoformat() if opportunity.created_at else None,
-            'updated_at': opportunity.updated_at.isoformat() if opportunity.updated_at else None,
+            'created_at': opportunity.created_at,
+            'updated_at': opportunity.updated_at,
         })
     
     elif request.method == 'DELETE':
@@ -533,25 +528,81 @@ def get_pipeline_data():
     """
     Returns combined customer/opportunity data for pipeline view
     """
-    # FILTER BY TENANT
-    customers = Customer.query.filter_by(tenant_id=g.tenant_id).all()
-    opportunities = Opportunity.query.filter_by(tenant_id=g.tenant_id).all()
-    
-    # Map opportunities by customer
-    opps_by_customer = {}
-    for opp in opportunities:
-        if opp.customer_id not in opps_by_customer:
-            opps_by_customer[opp.customer_id] = []
-        opps_by_customer[opp.customer_id].append(opp)
-    
-    pipeline_items = []
-    
-    for customer in customers:
-        customer_opps = opps_by_customer.get(customer.id, [])
+    try:
+        limit, cursor = get_page_args(request.args)  # optional ?limit=&cursor= keyset paging
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Dashboards poll this; answer unchanged data with 304 before running the join
+    etag = make_etag(request, g.tenant_id, Customer, Opportunity)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    # FILTER BY TENANT - one LEFT JOIN, ordered so each customer's rows are adjacent
+    query = db.session.query(Customer, Opportunity).outerjoin(
+        Opportunity,
+        and_(Opportunity.customer_id == Customer.id, Opportunity.tenant_id == g.tenant_id)
+    ).options(
+        # Only the columns the pipeline cards render (skips custom_data JSON etc.)
+        load_only(
+            Customer.id, Customer.name, Customer.company_name, Customer.address,
+            Customer.postcode, Customer.phone, Customer.email, Customer.industry,
+            Customer.company_size, Customer.contact_made, Customer.preferred_contact_method,
+            Customer.marketing_opt_in, Customer.stage, Customer.salesperson,
+            Customer.notes, Customer.status, Customer.created_at,
+        ),
+        load_only(
+            Opportunity.id, Opportunity.opportunity_name, Opportunity.opportunity_reference,
+            Opportunity.stage, Opportunity.priority, Opportunity.estimated_value,
+            Opportunity.probability, Opportunity.expected_close_date,
+            Opportunity.salesperson_name, Opportunity.notes, Opportunity.created_at,
+        ),
+    ).filter(
+        Customer.tenant_id == g.tenant_id
+    )
+    
+    cursor_out = None
+    if limit:
+        # Page over customers (not joined rows) so a customer's opportunities never split across pages
+        page = keyset_paginate(
+            Customer.query.with_entities(Customer.id, Customer.created_at).filter_by(tenant_id=g.tenant_id),
+            Customer, limit, cursor
+        ).all()
+        cursor_out = next_cursor(page, limit)
+        query = query.filter(Customer.id.in_([c.id for c in page]))
+    
+    # Fetch rows in batches from a server-side cursor instead of loading the whole result
+    rows = query.order_by(
+        Customer.created_at.desc(), Customer.id.desc(), Opportunity.created_at.desc()
+    ).yield_per(500)
+    
+    def generate():
+        # Encode one item at a time rather than materialising the full list before jsonify
+        dumps = current_app.json.dumps
+        yield '['
+        for i, item in enumerate(_iter_pipeline_items(rows)):
+            yield (',' if i else '') + dumps(item)
+        yield ']'
+    
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    response.set_etag(etag)
+    if cursor_out:
+        response.headers['X-Next-Cursor'] = cursor_out
+    return response
+
+
+def _iter_pipeline_items(rows):
+    """
+    Yield pipeline items from (Customer, Opportunity) rows grouped by customer
+    """
+    for _, group in groupby(rows, key=lambda row: row[0].id):
+        group = list(group)
+        customer = group[0][0]
         
-        if not customer_opps:
+        if group[0][1] is None:
             # Customer without opportunities (lead)
-            pipeline_items.append({
+            yield {
                 'id': f'customer-{customer.id}',
                 'type': 'customer',
                 'customer': {
@@ -571,46 +622,45 @@ def get_pipeline_data():
                     'salesperson': customer.salesperson,
                     'notes': customer.notes,
                     'status': customer.status,
-                    'created_at': customer.created_at.isoformat() if customer.created_at else None,
+                    'created_at': customer.created_at,
                 }
-            })
+            }
         else:
-            # Customer with opportunities
-            for opp in customer_opps:
-                pipeline_items.append({
+            # Customer with opportunities - build the customer dict once and share it
+            customer_dict = {
+                'id': customer.id,
+                'name': customer.name,
+                'company_name': customer.company_name,
+                'address': customer.address,
+                'phone': customer.phone,
+                'email': customer.email,
+                'industry': customer.industry,
+                'company_size': customer.company_size,
+                'contact_made': customer.contact_made,
+                'preferred_contact_method': customer.preferred_contact_method,
+                'stage': customer.stage,
+                'salesperson': customer.salesperson,
+                'status': customer.status,
+            }
+            for _, opp in group:
+                yield {
                     'id': f'opportunity-{opp.id}',
                     'type': 'opportunity',
-                    'customer': {
-                        'id': customer.id,
-                        'name': customer.name,
-                        'company_name': customer.company_name,
-                        'address': customer.address,
-                        'phone': customer.phone,
-                        'email': customer.email,
-                        'industry': customer.industry,
-                        'company_size': customer.company_size,
-                        'contact_made': customer.contact_made,
-                        'preferred_contact_method': customer.preferred_contact_method,
-                        'stage': customer.stage,
-                        'salesperson': customer.salesperson,
-                        'status': customer.status,
-                    },
+                    'customer': customer_dict,
                     'opportunity': {
                         'id': opp.id,
                         'opportunity_name': opp.opportunity_name,
                         'opportunity_reference': opp.opportunity_reference,
                         'stage': opp.stage,
                         'priority': opp.priority,
-                        'estimated_value': float(opp.estimated_value) if opp.estimated_value else None,
+                        'estimated_value': opp.estimated_value,
                         'probability': opp.probability,
-                        'expected_close_date': opp.expected_close_date.isoformat() if opp.expected_close_date else None,
+                        'expected_close_date': opp.expected_close_date,
                         'salesperson_name': opp.salesperson_name,
                         'notes': opp.notes,
-                        'created_at': opp.created_at.isoformat() if opp.created_at else None,
+                        'created_at': opp.created_at,
                     }
-                })
-    
-    return jsonify(pipeline_items)
+                }
 
 
 # ----------------------------------
@@ -99,14 +99,13 @@ def upload_drawing():
         unique_filename = f"{uuid.uuid4()}.{file_ext}"
         file_path = os.path.join(UPLOAD_FOLDER, unique_filename)
         
-        # Save file
-        file.save(file_path)
+        # Read the upload once; the same bytes are saved and passed to OCR
+        # (no save-then-read-back round trip through the filesystem)
+        image_bytes = file.read()
+        with open(file_path, 'wb') as f:
+            f.write(image_bytes)
         logger.info(f"📁 File saved: {file_path}")
         
-        # Read file bytes for OCR
-        with open(file_path, 'rb') as f:
-            image_bytes = f.read()
-        
         # Extract dimensions using OCR
         logger.info("🤖 Starting OCR extraction...")
         ocr_result = ocr_extractor.extract_dimensions(image_bytes)
@@ -2,6 +2,7 @@ from flask import request, jsonify, send_file
 from werkzeug.utils import secure_filename
 from datetime import datetime
 import os
+import uuid
 from config import app, latest_structured_data
 from utils.file_utils import allowed_file
 from utils.openai_utils import process_image_with_openai_vision
@@ -38,7 +39,8 @@ def upload_image():
             return jsonify({'error': 'Invalid file type. Please upload an image.'}), 400
 
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        # Unique prefix so concurrent uploads of the same name don't overwrite each other
+        file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}_{filename}")
         file.save(file_path)
 
         print(f"Processing file: {filename}")
@@ -1,11 +1,15 @@
 # routes/job_routes.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from database import db
 from models import Job, Customer, Opportunity, generate_job_reference
 from datetime import datetime, date
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 import json
 from tenant_middleware import require_tenant as token_required
+from utils.pagination import get_page_args, keyset_paginate, next_cursor
+from utils.date_utils import parse_date
+from utils.etag import make_etag, not_modified
 
 
 job_bp = Blueprint("jobs", __name__)
@@ -15,7 +19,7 @@ def parse_iso_date_safe(value):
         return None
     if isinstance(value, str):
         try:
-            return datetime.strptime(value, "%Y-%m-%d").date()
+            return parse_date(value)
         except Exception:
             try:
                 return datetime.fromisoformat(value).date()
@@ -162,8 +166,20 @@ def get_jobs():
     team = request.args.get("team", type=str)
     from_date = request.args.get("from_date", type=str)
     to_date = request.args.get("to_date", type=str)
+    try:
+        limit, cursor = get_page_args(request.args)  # optional ?limit=&cursor= keyset paging
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Dashboards poll this; answer unchanged data with 304 before running the list query.
+    # This route isn't tenant-scoped, so the version covers all jobs/customers.
+    etag = make_etag(request, getattr(g, "tenant_id", None), Job, Customer)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
 
-    query = Job.query  # type: Query
+    # customer.name is read for every row; JOIN it in rather than lazy-loading per job
+    query = Job.query.options(joinedload(Job.customer).load_only(Customer.name))  # type: Query
 
     # Basic filters
     if ref:
@@ -203,7 +219,7 @@ def get_jobs():
     except Exception:
         pass
 
-    jobs = query.order_by(Job.created_at.desc()).all()
+    jobs = keyset_paginate(query, Job, limit, cursor).all()
 
     def job_to_json(j):
         return {
@@ -229,7 +245,12 @@ def get_jobs():
             "updated_at": j.updated_at.isoformat() if j.updated_at else None
         }
 
-    return jsonify([job_to_json(j) for j in jobs]), 200
+    response = jsonify([job_to_json(j) for j in jobs])
+    response.set_etag(etag)
+    cursor_out = next_cursor(jobs, limit)
+    if cursor_out:
+        response.headers["X-Next-Cursor"] = cursor_out
+    return response, 200
 
 
 # ----------------------------
@@ -115,20 +115,16 @@ class ImagePreprocessor:
             logger.debug("No lines detected for deskew")
             return image, 0.0
         
-        # Calculate dominant angle
-        angles = []
-        for line in lines[:50]:  # First 50 lines
-            rho, theta = line[0]
-            angle = (theta * 180 / np.pi) - 90
-            
-            # Filter near-horizontal/vertical
-            if abs(angle) < 5 or abs(angle - 90) < 5:
-                angles.append(angle)
+        # Calculate dominant angle - lines is (N, 1, 2) of (rho, theta); take first 50 lines as one array
+        angles = np.degrees(lines[:50, 0, 1]) - 90
+        
+        # Filter near-horizontal/vertical
+        angles = angles[(np.abs(angles) < 5) | (np.abs(angles - 90) < 5)]
         
-        if not angles:
+        if angles.size == 0:
             return image, 0.0
         
-        median_angle = np.median(angles)
+        median_angle = float(np.median(angles))
         
         # Only rotate if significantly skewed
         if abs(median_angle) > 0.5:
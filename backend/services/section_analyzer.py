@@ -11,6 +11,10 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used on every model response
+_JSON_OBJECT_RE = re.compile(r'\{[^}]+\}', re.DOTALL)
+_DEPTH_MM_RE = re.compile(r'(\d{3,4})\s*mm')
+
 
 class SectionAnalyzer:
     """Analyze individual cabinet sections"""
@@ -123,7 +127,7 @@ class SectionAnalyzer:
             logger.debug(f"Section {index} AI result: {result_text}")
             
             # Parse JSON
-            json_match = re.search(r'\{[^}]+\}', result_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(result_text)
             
             if json_match:
                 data = json.loads(json_match.group())
@@ -147,7 +151,7 @@ class SectionAnalyzer:
                 }
             
             # Fallback parsing
-            depth_match = re.search(r'(\d{3,4})\s*mm', result_text)
+            depth_match = _DEPTH_MM_RE.search(result_text)
             if depth_match:
                 depth = int(depth_match.group(1))
                 
@@ -198,12 +202,10 @@ class SectionAnalyzer:
         
         horizontal_lines = 0
         if lines is not None:
-            for line in lines:
-                x1, y1, x2, y2 = line[0]
-                angle = abs(np.arctan2(y2 - y1, x2 - x1) * 180 / np.pi)
-                
-                if angle < 10:  # Horizontal
-                    horizontal_lines += 1
+            # lines is (N, 1, 4) of x1, y1, x2, y2 - compute all angles in one array op
+            x1, y1, x2, y2 = lines[:, 0, :].astype(np.float64).T
+            angles = np.abs(np.degrees(np.arctan2(y2 - y1, x2 - x1)))
+            horizontal_lines = int(np.count_nonzero(angles < 10))  # Horizontal
         
         shelves = min(horizontal_lines // 2, 3)  # Estimate shelves
         
@@ -9,6 +9,10 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used on every model/OCR response
+_JSON_OBJECT_RE = re.compile(r'\{[^}]+\}', re.DOTALL)
+_NUMBER_RE = re.compile(r'\b\d{2,4}\b')
+
 
 class SectionDetector:
     """Detect individual cabinet sections using dimension-driven approach"""
@@ -177,7 +181,7 @@ class SectionDetector:
             
             # Parse JSON response
             import json
-            json_match = re.search(r'\{[^}]+\}', result_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(result_text)
             
             if json_match:
                 data = json.loads(json_match.group())
@@ -196,7 +200,7 @@ class SectionDetector:
             
             # Fallback: Extract numbers from text
             logger.warning("Failed to parse JSON, trying text extraction...")
-            numbers = re.findall(r'\b\d{2,4}\b', result_text)
+            numbers = _NUMBER_RE.findall(result_text)
             cabinet_widths = [int(n) for n in numbers if 50 <= int(n) <= 3000]
             
             # Filter: likely cabinet widths
@@ -241,7 +245,7 @@ class SectionDetector:
             logger.debug(f"OCR text: {text}")
             
             # Extract numbers
-            numbers = re.findall(r'\b\d{2,4}\b', text)
+            numbers = _NUMBER_RE.findall(text)
             cabinet_widths = [int(n) for n in numbers if 100 <= int(n) <= 2000 or 50 <= int(n) < 200]
             
             # Remove duplicates while preserving order
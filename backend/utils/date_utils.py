@@ -0,0 +1,40 @@
+import re
+from datetime import datetime, date, time
+
+# fromisoformat also takes compact/week dates and UTC offsets that strptime('%Y-%m-%d')
+# rejected, so only exact zero-padded input gets the fast path
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_HH_MM_RE = re.compile(r'\d{2}:\d{2}')
+
+
+def parse_date(value):
+    """
+    Parse a YYYY-MM-DD string to a date.
+    Uses the C fromisoformat fast path for zero-padded input, strptime otherwise
+    (e.g. '2030-1-5'). Raises ValueError for anything else.
+    """
+    if _ISO_DATE_RE.fullmatch(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def parse_time(value):
+    """
+    Parse an HH:MM string to a time.
+    Uses the C fromisoformat fast path for zero-padded input, strptime otherwise
+    (e.g. '9:00'). Raises ValueError for anything else, including seconds/offsets.
+    """
+    if _HH_MM_RE.fullmatch(value):
+        return time.fromisoformat(value)
+    return datetime.strptime(value, '%H:%M').time()
+
+
+def parse_datetime(value):
+    """
+    Parse a YYYY-MM-DD string to a naive datetime at midnight.
+    Uses the C fromisoformat fast path for zero-padded input, strptime otherwise
+    (e.g. '2030-1-5'). Raises ValueError for anything else, including times/offsets.
+    """
+    if _ISO_DATE_RE.fullmatch(value):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d')
@@ -0,0 +1,41 @@
+import hashlib
+from flask import Response
+from sqlalchemy import func
+from database import db
+
+
+def tenant_data_version(tenant_id, *models):
+    """
+    Cheap fingerprint of the tenant's rows in `models`: (count, max(updated_at)) per table.
+    Any insert, update (via onupdate) or delete changes it.
+    tenant_id=None covers all rows, for endpoints that don't filter by tenant.
+    max(updated_at) is an index probe via the *_updated indexes; count() is still an
+    index-only scan over the matching rows, so the cost grows with table size.
+    """
+    version = []
+    for model in models:
+        query = db.session.query(func.count(model.id), func.max(model.updated_at))
+        if tenant_id is not None:
+            query = query.filter(model.tenant_id == tenant_id)
+        count, last_updated = query.one()
+        version.append(f"{model.__tablename__}:{count}:{last_updated.isoformat() if last_updated else ''}")
+    return version
+
+
+def make_etag(request, tenant_id, *models):
+    """
+    ETag for a list endpoint: tenant data version + query string (filters/paging)
+    """
+    parts = [tenant_id or '', request.query_string.decode('utf-8')] + tenant_data_version(tenant_id, *models)
+    return hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def not_modified(request, etag):
+    """
+    Return a 304 response if the client already has this version, else None
+    """
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
@@ -1,17 +1,73 @@
 import base64
+import io
 import os
+from PIL import Image, ImageOps
 from werkzeug.utils import secure_filename
 from config import ALLOWED_EXTENSIONS
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def read_image_bytes(image_path):
+    """
+    Read an image file into bytes.
+    Reads straight from the fd into a right-sized buffer, skipping the BufferedReader layer.
+    """
+    fd = os.open(image_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+    finally:
+        os.close(fd)
+
+# Images above this size are downscaled before being sent to a vision API
+MAX_UPLOAD_IMAGE_BYTES = 2 * 1024 * 1024
+MAX_UPLOAD_IMAGE_DIM = 2048
+
+def shrink_image_bytes(content, mime_type):
+    """
+    Downscale/recompress large images (e.g. phone photos) to at most
+    MAX_UPLOAD_IMAGE_DIM px on the long side as JPEG q85.
+    Returns (content, mime_type); small or unreadable images are returned unchanged.
+    """
+    if len(content) <= MAX_UPLOAD_IMAGE_BYTES:
+        return content, mime_type
+    try:
+        image = Image.open(io.BytesIO(content))
+        # Phone photos are often stored sideways with an EXIF Orientation tag;
+        # re-encoding drops the tag, so rotate the pixels first
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((MAX_UPLOAD_IMAGE_DIM, MAX_UPLOAD_IMAGE_DIM), Image.LANCZOS)
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            # JPEG has no alpha; flatten onto white so transparent areas don't turn
+            # black and hide dark form text
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85, optimize=True)
+    except Exception:
+        return content, mime_type
+    shrunk = buffer.getvalue()
+    if len(shrunk) >= len(content):
+        return content, mime_type
+    return shrunk, 'image/jpeg'
+
 def encode_image_to_base64(image_path):
     """
     Encode image to base64 string for OpenAI Vision API
     """
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+    return base64.b64encode(read_image_bytes(image_path)).decode('utf-8')
 
 def get_image_mime_type(file_path):
     """
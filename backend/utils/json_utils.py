@@ -0,0 +1,84 @@
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from operator import attrgetter
+from flask.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    # orjson is in requirements.txt; keep serving with the stdlib encoder but make a broken deploy visible
+    logger.warning("orjson is not installed - falling back to the slower stdlib JSON encoder")
+    orjson = None
+
+
+def _default(o):
+    """
+    Encode values the JSON encoder doesn't handle natively.
+    Dates/times are emitted as ISO-8601 strings (same as .isoformat())
+    """
+    if isinstance(o, Decimal):
+        return float(o)
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    return DefaultJSONProvider.default(o)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    orjson encodes datetime/date/time natively in C, so routes can pass
+    model attributes straight through instead of calling .isoformat() per field.
+    """
+    default = staticmethod(_default)
+
+    def dumps(self, obj, **kwargs):
+        # Explicit encoder options (sort_keys, separators, ...) go to the stdlib encoder
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        # orjson takes no options; callers passing object_hook etc. (e.g. the
+        # session's TaggedJSONSerializer) need the stdlib decoder
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # Hand the encoded bytes straight to the response, skipping the str round-trip
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype,
+        )
+
+
+def make_serializer(fields):
+    """
+    Build a function that turns a model instance into a dict.
+    `fields` maps output keys to attribute names; all attributes are read by one
+    attrgetter call rather than a separate lookup per dict entry.
+    Decimal/date values are left to the JSON provider's default hook.
+    """
+    keys = tuple(fields)
+    getter = attrgetter(*fields.values())
+
+    if len(keys) == 1:
+        # attrgetter with one name returns the bare value, not a 1-tuple
+        key = keys[0]
+
+        def serialize(obj):
+            return {key: getter(obj)}
+
+        return serialize
+
+    def serialize(obj):
+        return dict(zip(keys, getter(obj)))
+
+    return serialize
@@ -1,24 +1,35 @@
+import base64
+import hashlib
 import json
+import logging
+import threading
 from openai import OpenAI
 from config import FORM_COLUMNS, latest_structured_data
-from utils.file_utils import encode_image_to_base64, get_image_mime_type
+from utils.file_utils import read_image_bytes, get_image_mime_type, shrink_image_bytes
 import os
 
+logger = logging.getLogger(__name__)
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def process_image_with_openai_vision(file_path):
-    """
-    Process image using OpenAI Vision API to extract and structure form data
-    """
-    try:
-        print(f"Processing image: {file_path}")
-        
-        base64_image = encode_image_to_base64(file_path)
-        mime_type = get_image_mime_type(file_path)
-        
-        column_list = ", ".join(FORM_COLUMNS)
-        
-        prompt = f"""
+# Extracted form data keyed by sha256 of the image bytes, so re-uploads/retries
+# of the same image skip the Vision API call. Only successful results are stored.
+_RESULT_CACHE = {}
+_RESULT_CACHE_MAX = 256
+# Guards eviction + insert so concurrent gunicorn threads can't evict the same key
+_RESULT_CACHE_LOCK = threading.Lock()
+
+CHECKBOX_FIELDS = frozenset([
+    'bedside_cabinets_floating', 'bedside_cabinets_fitted', 'bedside_cabinets_freestand',
+    'dresser_desk_yes', 'dresser_desk_no', 'internal_mirror_yes', 'internal_mirror_no',
+    'mirror_silver', 'mirror_bronze', 'mirror_grey', 'soffit_lights_spot', 'soffit_lights_strip',
+    'soffit_lights_cool_white', 'soffit_lights_warm_white', 'gable_lights_black', 'gable_lights_white',
+    'carpet_protection', 'floor_tile_protection', 'no_floor'
+])
+
+# Prompt only depends on FORM_COLUMNS, so build it once at import
+_COLUMN_LIST = ", ".join(FORM_COLUMNS)
+FORM_PROMPT = f"""
         You are analyzing a BEDROOM CHECKLIST form image. Extract all visible information and organize it into a JSON format using ONLY these exact field names.
 
         CRITICAL INSTRUCTIONS FOR CHECKBOXES - READ CAREFULLY:
@@ -33,12 +44,33 @@ def process_image_with_openai_vision(file_path):
         8. Return valid JSON only
 
         FIELD NAMES TO USE:
-        {column_list}
+        {_COLUMN_LIST}
 
         Return only the JSON object with the extracted data. Do not include any explanatory text.
         """
 
-        print("Sending request to OpenAI Vision API...")
+
+def process_image_with_openai_vision(file_path):
+    """
+    Process image using OpenAI Vision API to extract and structure form data
+    """
+    try:
+        logger.debug("Processing image: %s", file_path)
+        
+        content = read_image_bytes(file_path)
+        digest = hashlib.sha256(content).hexdigest()
+        
+        cached = _RESULT_CACHE.get(digest)
+        if cached is not None:
+            logger.debug("Using cached result for image %.12s", digest)
+            latest_structured_data.update(cached)
+            return dict(cached)
+        
+        # Large photos are downscaled first; the cache stays keyed on the original bytes
+        upload_bytes, mime_type = shrink_image_bytes(content, get_image_mime_type(file_path))
+        base64_image = base64.b64encode(upload_bytes).decode('utf-8')
+        
+        logger.debug("Sending request to OpenAI Vision API...")
         response = client.chat.completions.create(
             model="gpt-4o",
             messages=[
@@ -49,7 +81,7 @@ def process_image_with_openai_vision(file_path):
                 {
                     "role": "user",
                     "content": [
-                        {"type": "text", "text": prompt},
+                        {"type": "text", "text": FORM_PROMPT},
                         {"type": "image_url", "image_url": {"url": f"data:{mime_type};base64,{base64_image}", "detail": "high"}}
                     ]
                 }
@@ -59,7 +91,7 @@ def process_image_with_openai_vision(file_path):
         )
 
         reply = response.choices[0].message.content.strip()
-        print(f"OpenAI Vision response length: {len(reply)}")
+        logger.debug("OpenAI Vision response length: %d", len(reply))
         
         if reply.startswith('```json'):
             reply = reply[7:]
@@ -70,30 +102,27 @@ def process_image_with_openai_vision(file_path):
         try:
             structured_data = json.loads(reply)
             final_data = {}
-            checkbox_fields = [
-                'bedside_cabinets_floating', 'bedside_cabinets_fitted', 'bedside_cabinets_freestand',
-                'dresser_desk_yes', 'dresser_desk_no', 'internal_mirror_yes', 'internal_mirror_no',
-                'mirror_silver', 'mirror_bronze', 'mirror_grey', 'soffit_lights_spot', 'soffit_lights_strip',
-                'soffit_lights_cool_white', 'soffit_lights_warm_white', 'gable_lights_black', 'gable_lights_white',
-                'carpet_protection', 'floor_tile_protection', 'no_floor'
-            ]
-            
             for column in FORM_COLUMNS:
                 value = structured_data.get(column, None)
-                if column in checkbox_fields:
+                if column in CHECKBOX_FIELDS:
                     final_data[column] = "✓" if value in ["✓", "checked", True, "true"] else None
                 else:
                     final_data[column] = None if value in ["", "null", "None"] else value
             
-            global latest_structured_data
             latest_structured_data.update(final_data)
+            
+            with _RESULT_CACHE_LOCK:
+                if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    _RESULT_CACHE.pop(next(iter(_RESULT_CACHE), None), None)
+                _RESULT_CACHE[digest] = dict(final_data)
             return final_data
             
         except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            print(f"Raw response: {reply}")
+            logger.warning("JSON parsing error: %s", e)
+            logger.debug("Raw response: %s", reply)
             return {"error": "Failed to parse JSON response from OpenAI Vision", "raw_response": reply, "json_error": str(e)}
             
     except Exception as e:
-        print(f"OpenAI Vision API error: {str(e)}")
+        logger.exception("OpenAI Vision API error")
         return {"error": f"OpenAI Vision API error: {str(e)}"}
\ No newline at end of file
@@ -0,0 +1,73 @@
+import base64
+from datetime import datetime
+from sqlalchemy import tuple_
+
+# Upper bound for ?limit= on keyset-paginated list endpoints
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(created_at, id_):
+    """
+    Encode the (created_at, id) of the last row on a page as an opaque cursor
+    """
+    raw = f"{created_at.isoformat()}|{id_}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor back into (created_at, id). Raises ValueError if malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        created_at, id_ = raw.split('|', 1)
+        return datetime.fromisoformat(created_at), id_
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def get_page_args(args):
+    """
+    Read ?limit= and ?cursor= from request args.
+    Returns (limit, cursor); limit is None when the client didn't ask for paging.
+    Raises ValueError on a bad limit or cursor.
+    """
+    raw_limit = args.get('limit')
+    cursor = args.get('cursor')
+
+    if raw_limit is None:
+        if cursor:
+            raise ValueError('cursor requires limit')
+        return None, None
+    try:
+        limit = int(raw_limit)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        # Don't silently fall back to the unbounded list on ?limit=abc
+        raise ValueError('limit must be a positive integer')
+
+    return min(limit, MAX_PAGE_SIZE), decode_cursor(cursor) if cursor else None
+
+
+def keyset_paginate(query, model, limit=None, cursor=None):
+    """
+    Order newest-first by (created_at, id) and seek past the cursor.
+    Uses a row-value comparison instead of OFFSET so deep pages cost the same as the first.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        query = query.filter(tuple_(model.created_at, model.id) < cursor)
+    if limit:
+        query = query.limit(limit)
+    return query
+
+
+def next_cursor(rows, limit):
+    """
+    Cursor for the page after `rows`, or None if this was the last page
+    """
+    if not limit or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)